@@ -9,6 +9,8 @@ Process qwen-tts.jpeg:
 Can be run from either project root or assets/ directory.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
@@ -48,24 +50,28 @@ def apply_mask(image, mask):
     if mask.mode != "RGBA":
         mask = mask.convert("RGBA")
 
-    # Resize mask to match image size if needed
-    if mask.size != image.size:
-        mask = mask.resize(image.size, Image.Resampling.LANCZOS)
+    # Only the mask's alpha is used, so resize that single L-mode band
+    # rather than the whole RGBA mask
+    mask_alpha = mask.getchannel("A")
+    factor = mask_alpha.width // image.width
+    if factor >= 2 and mask_alpha.size == (image.width * factor, image.height * factor):
+        # Exact integer downscale (e.g. the 2048px example.png): a box reduce
+        # averages each factor x factor block and is far cheaper than Lanczos
+        mask_alpha = mask_alpha.reduce(factor)
+    elif mask_alpha.size != image.size:
+        mask_alpha = mask_alpha.resize(image.size, Image.Resampling.LANCZOS)
 
-    # Extract alpha channel from mask
-    mask_alpha = mask.split()[3]  # Alpha channel
+    # Use the mask's alpha as the final alpha, replacing the image's alpha
+    # band in place instead of splitting and re-merging all four bands
+    image.putalpha(mask_alpha)
 
-    # Apply mask to image
-    # Split image into channels
-    r, g, b, a = image.split()
+    return image
 
-    # We use the mask's alpha as the final alpha
-    new_alpha = mask_alpha
 
-    # Merge channels back
-    result = Image.merge("RGBA", (r, g, b, new_alpha))
-
-    return result
+def save_all(image, filenames):
+    """Save one image under each of the given filenames in DEST_DIR."""
+    for filename in filenames:
+        image.save(DEST_DIR / filename)
 
 
 def main():
@@ -85,6 +91,10 @@ def main():
     source = Image.open(SOURCE_IMAGE)
     print(f"  Original size: {source.size}")
 
+    # Let libjpeg decode at the smallest DCT scale that still covers the
+    # target size; no effect when the source is already small enough
+    source.draft("RGB", TARGET_SIZE)
+
     # Load mask image
     print(f"Loading {MASK_IMAGE.name}...")
     mask = Image.open(MASK_IMAGE)
@@ -104,11 +114,30 @@ def main():
     print("  Saved!")
 
     # Generate all icon sizes
+    # Each level of the pyramid is downsampled from the previous (larger) one
+    # instead of from the full-size image, and every size is resized only once
+    # even when it is saved under several filenames.
     print(f"\nGenerating icon sizes in {DEST_DIR.relative_to(PROJECT_ROOT)}...")
+    groups = defaultdict(list)
     for size, filename in SIZES:
-        resized = masked_image.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(DEST_DIR / filename)
-        print(f"  Generated {filename} ({size}x{size})")
+        groups[size].append(filename)
+
+    # PNG encoding runs on a worker thread (Pillow releases the GIL while
+    # encoding) so it overlaps with the next resize on the main thread.
+    # Image.save() mutates the image's encoder state, so all filenames of one
+    # size are saved by a single task, one after another.
+    current = masked_image
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        saves = []
+        for size in sorted(groups, reverse=True):
+            if current.size != (size, size):
+                current = current.resize((size, size), Image.Resampling.LANCZOS)
+            saves.append((pool.submit(save_all, current, groups[size]), size))
+
+        for future, size in saves:
+            future.result()
+            for filename in groups[size]:
+                print(f"  Generated {filename} ({size}x{size})")
 
     print("\nAll done!")
     return 0
@@ -9,17 +9,24 @@ FastAPI-based HTTP server that provides:
 - Health monitoring
 
 Usage:
-    python tts_server.py [--port PORT] [--host HOST]
+    python tts_server.py [--port PORT] [--host HOST] [--preload MODEL_ID ...]
 """
 
 import os
 import sys
+import asyncio
 import gc
 import time
+import itertools
+import atexit
+import queue
 import logging
+import logging.handlers
 import threading
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Any
 from dataclasses import dataclass
 from enum import Enum
 from contextlib import asynccontextmanager
@@ -35,6 +42,7 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 import uvicorn
 
+import mlx.core as mx
 from mlx_audio.tts.utils import load_model
 
 
@@ -51,7 +59,15 @@ def setup_logging() -> logging.Logger:
     handler = logging.StreamHandler(sys.stderr)
     handler.setLevel(logging.DEBUG)
     handler.setFormatter(logging.Formatter("%(message)s"))
-    logger.addHandler(handler)
+
+    # Callers only enqueue records; a listener thread formats and writes them,
+    # so request handlers never wait on the stream handler's lock or on stderr
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # Flush queued records on exit, including when startup fails
+    atexit.register(listener.stop)
 
     return logger
 
@@ -59,10 +75,26 @@ def setup_logging() -> logging.Logger:
 logger = setup_logging()
 
 
+# Handle to this process, created once instead of on every memory query
+_PROCESS = psutil.Process(os.getpid())
+
+
 def get_memory_mb() -> float:
     """Get current process RSS memory in MB."""
-    process = psutil.Process(os.getpid())
-    return process.memory_info().rss / (1024 * 1024)
+    return _PROCESS.memory_info().rss / (1024 * 1024)
+
+
+# All MLX work (model load and unload, generation and the WAV writing that
+# drives it) runs on this single thread: MLX keeps per-thread default streams
+# and must not be driven from several threads, and one worker also serializes
+# MLX operations by construction.
+mlx_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mlx")
+
+
+async def run_mlx(func, *args):
+    """Run ``func(*args)`` on the MLX thread and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(mlx_executor, func, *args)
 
 
 # =============================================================================
@@ -113,19 +145,27 @@ class ModelRegistry:
         for model_id in self.CLONE_MODELS + self.CONTROL_MODELS + [self.DESIGN_MODEL]:
             self._models[model_id] = ModelInfo(model_id=model_id)
 
+        self._snapshot: Mapping[str, ModelInfo] = MappingProxyType(dict(self._models))
+
     def get_model(self, model_id: str) -> Optional[ModelInfo]:
-        with self._lock:
-            return self._models.get(model_id)
+        """Look up a model without taking the lock.
+
+        Reads go through an immutable snapshot of the model table, republished
+        whenever a model id is added, so they never see the dict change size.
+        Writers set ModelInfo fields before switching state, so a LOADED model
+        always has its instance.
+        """
+        return self._snapshot.get(model_id)
 
     def get_all_models(self) -> List[ModelInfo]:
-        with self._lock:
-            return list(self._models.values())
+        return list(self._snapshot.values())
 
     def load_model(self, model_id: str) -> ModelInfo:
         """Load a model into memory."""
         with self._lock:
             if model_id not in self._models:
                 self._models[model_id] = ModelInfo(model_id=model_id)
+                self._snapshot = MappingProxyType(dict(self._models))
 
             info = self._models[model_id]
 
@@ -138,6 +178,10 @@ class ModelRegistry:
                 logger.warning(f"Model {model_id} is already loading")
                 return info
 
+            if info.state == ModelState.UNLOADING:
+                logger.warning(f"Model {model_id} is unloading")
+                return info
+
             # Start loading
             info.state = ModelState.LOADING
             info.error_message = None
@@ -157,12 +201,12 @@ class ModelRegistry:
 
             with self._lock:
                 info = self._models[model_id]
-                info.state = ModelState.LOADED
                 info.model_instance = model
                 info.memory_before_mb = memory_before
                 info.memory_after_mb = memory_after
                 info.memory_delta_mb = memory_delta
                 info.load_time_seconds = load_time
+                info.state = ModelState.LOADED
 
             logger.info("Model loaded successfully")
             logger.debug(f"Memory after load: {memory_after:.1f} MB ({memory_delta:+.1f} MB)")
@@ -176,13 +220,13 @@ class ModelRegistry:
 
             with self._lock:
                 info = self._models[model_id]
-                info.state = ModelState.ERROR
                 info.error_message = error_msg
+                info.state = ModelState.ERROR
 
             raise
 
-    def unload_model(self, model_id: str) -> ModelInfo:
-        """Unload a model from memory and force garbage collection."""
+    def unload_model(self, model_id: str, force_gc: bool = False) -> ModelInfo:
+        """Unload a model from memory, optionally forcing garbage collection."""
         with self._lock:
             if model_id not in self._models:
                 raise ValueError(f"Unknown model: {model_id}")
@@ -204,11 +248,13 @@ class ModelRegistry:
             info = self._models[model_id]
             info.model_instance = None
 
-        # Force garbage collection
-        gc.collect()
+        # Reference counting frees the model as soon as the reference above is
+        # dropped; a full collection scans the whole heap and is only needed
+        # to break reference cycles, so it is opt-in
+        if force_gc:
+            gc.collect()
 
         # Clear MLX cache
-        import mlx.core as mx
         mx.clear_cache()
         logger.debug("Cleared MLX cache")
 
@@ -217,10 +263,10 @@ class ModelRegistry:
 
         with self._lock:
             info = self._models[model_id]
-            info.state = ModelState.UNLOADED
             info.memory_before_mb = memory_before
             info.memory_after_mb = memory_after
             info.memory_delta_mb = memory_delta
+            info.state = ModelState.UNLOADED
 
         logger.info("Model unloaded successfully")
         logger.debug(f"Memory after unload: {memory_after:.1f} MB ({memory_delta:+.1f} MB)")
@@ -240,6 +286,11 @@ class LoadModelRequest(BaseModel):
     model_id: str
 
 
+class UnloadModelRequest(BaseModel):
+    model_id: str
+    force_gc: bool = False
+
+
 class MemoryStats(BaseModel):
     before_mb: Optional[float] = None
     after_mb: Optional[float] = None
@@ -307,6 +358,17 @@ class GenerateResponse(BaseModel):
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     logger.info("TTS HTTP Server starting up...")
+
+    # Load requested models before serving, so the first generation request
+    # does not pay the load cost. Loads run one after another: MLX must not be
+    # driven from several threads, and each model's memory delta is a
+    # whole-process RSS sample that would otherwise include the other loads.
+    preload_model_ids = app.state.preload_model_ids
+    if preload_model_ids:
+        logger.info(f"Preloading models: {', '.join(preload_model_ids)}")
+        for model_id in preload_model_ids:
+            await run_mlx(registry.load_model, model_id)
+
     yield
     logger.info("TTS HTTP Server shutting down...")
 
@@ -317,6 +379,7 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan
 )
+app.state.preload_model_ids = []
 
 
 # =============================================================================
@@ -359,7 +422,7 @@ async def list_models():
 async def load_model_endpoint(request: LoadModelRequest):
     """Load a model into memory."""
     try:
-        info = registry.load_model(request.model_id)
+        info = await run_mlx(registry.load_model, request.model_id)
         return LoadModelResponse(
             model_id=info.model_id,
             state=info.state.value,
@@ -382,10 +445,10 @@ async def load_model_endpoint(request: LoadModelRequest):
 
 
 @app.post("/models/unload", response_model=UnloadModelResponse)
-async def unload_model_endpoint(request: LoadModelRequest):
+async def unload_model_endpoint(request: UnloadModelRequest):
     """Unload a model from memory."""
     try:
-        info = registry.unload_model(request.model_id)
+        info = await run_mlx(registry.unload_model, request.model_id, request.force_gc)
         return UnloadModelResponse(
             model_id=info.model_id,
             state=info.state.value,
@@ -409,11 +472,85 @@ async def unload_model_endpoint(request: LoadModelRequest):
 # Generation Endpoints
 # =============================================================================
 
-def save_audio(audio, sample_rate: int, output_path: str):
-    """Save audio numpy array to WAV file."""
-    audio_np = np.array(audio)
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    sf.write(output_path, audio_np, sample_rate)
+# Frames quantized and handed to libsndfile per write, bounding the
+# temporary buffers to this size regardless of the audio length
+WRITE_BLOCK_FRAMES = 16384
+
+
+def to_pcm16(audio: np.ndarray, scratch: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Clip float audio to [-1, 1] and quantize it to 16-bit PCM samples.
+
+    ``scratch`` (float32) and ``out`` (int16) are caller-owned buffers of at
+    least ``len(audio)`` frames, reused across blocks so quantizing does not
+    allocate. Returns the filled prefix of ``out``.
+    """
+    n = len(audio)
+    scaled = np.clip(audio, -1.0, 1.0, out=scratch[:n])
+    np.multiply(scaled, 32767, out=scaled)
+    # Round to nearest; a bare int cast would truncate every sample toward zero
+    np.rint(scaled, out=scaled)
+    pcm = out[:n]
+    np.copyto(pcm, scaled, casting="unsafe")
+    return pcm
+
+
+def validate_output_path(output_path: str):
+    """Make sure the output file can be written before spending time generating."""
+    path = Path(output_path)
+    if path.is_dir():
+        raise HTTPException(status_code=400, detail=f"Output path is a directory: {output_path}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise HTTPException(status_code=400, detail=f"Cannot create {path.parent}: {e}")
+    if not os.access(path.parent, os.W_OK):
+        raise HTTPException(status_code=400, detail=f"Cannot write to {path.parent}")
+
+
+def save_audio(results, sample_rate: int, output_path: str):
+    """Write generation results to a WAV file as they are produced."""
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
+        raise RuntimeError("No audio generated")
+
+    path = Path(output_path)
+    # Write next to the output and move into place only once generation has
+    # finished, so a failure never truncates an existing file at output_path.
+    # The .part name keeps the real extension for soundfile's format lookup.
+    part_path = path.with_suffix(".part" + path.suffix)
+    scratch = np.empty(WRITE_BLOCK_FRAMES, dtype=np.float32)
+    pcm = np.empty(WRITE_BLOCK_FRAMES, dtype=np.int16)
+    try:
+        with sf.SoundFile(part_path, "w", samplerate=sample_rate, channels=1, subtype="PCM_16") as f:
+            for result in itertools.chain([first], results):
+                # np.asarray() reuses ndarrays and buffer-protocol arrays
+                # (mx.array) as they are instead of copying them
+                audio = np.asarray(result.audio)
+                for start in range(0, len(audio), WRITE_BLOCK_FRAMES):
+                    block = audio[start:start + WRITE_BLOCK_FRAMES]
+                    f.write(to_pcm16(block, scratch, pcm))
+        os.replace(part_path, path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+def generate_to_file(model_id: str, method_name: str, kwargs: Dict[str, Any], output_path: str):
+    """Run a generation method of a loaded model and save its audio; MLX thread only."""
+    # Resolved here rather than in the handler, since an unload queued ahead
+    # of this job may have dropped the model in the meantime
+    info = registry.get_model(model_id)
+    if not info or info.state != ModelState.LOADED:
+        raise HTTPException(status_code=400, detail=f"Model {model_id} not loaded")
+
+    model = info.model_instance
+    try:
+        save_audio(getattr(model, method_name)(**kwargs), model.sample_rate, output_path)
+    finally:
+        # Release the Metal buffers MLX cached for this generation, also on
+        # failure, so memory does not creep up across requests
+        mx.clear_cache()
 
 
 @app.post("/generate/clone", response_model=GenerateResponse)
@@ -422,11 +559,9 @@ async def generate_clone(request: GenerateCloneRequest):
     info = registry.get_model(request.model_id)
     if not info or info.state != ModelState.LOADED:
         raise HTTPException(status_code=400, detail=f"Model {request.model_id} not loaded")
+    validate_output_path(request.output_path)
 
-    model = info.model_instance
-    sample_rate = model.sample_rate
-
-    logger.info("Processing reference audio...")
+    logger.debug("Processing reference audio...")
 
     kwargs = {
         "text": request.text,
@@ -436,14 +571,7 @@ async def generate_clone(request: GenerateCloneRequest):
         kwargs["ref_text"] = request.ref_text
 
     logger.info("Generating audio...")
-    results = list(model.generate(**kwargs))
-
-    if not results:
-        raise RuntimeError("No audio generated")
-
-    logger.info("Saving output...")
-    audio = results[0].audio
-    save_audio(audio, sample_rate, request.output_path)
+    await run_mlx(generate_to_file, info.model_id, "generate", kwargs, request.output_path)
     logger.info(f"Generated clone audio: {request.output_path}")
 
     return GenerateResponse(output_path=request.output_path, success=True)
@@ -455,11 +583,9 @@ async def generate_control(request: GenerateControlRequest):
     info = registry.get_model(request.model_id)
     if not info or info.state != ModelState.LOADED:
         raise HTTPException(status_code=400, detail=f"Model {request.model_id} not loaded")
+    validate_output_path(request.output_path)
 
-    model = info.model_instance
-    sample_rate = model.sample_rate
-
-    logger.info("Preparing generation parameters...")
+    logger.debug("Preparing generation parameters...")
 
     kwargs = {
         "text": request.text,
@@ -470,14 +596,7 @@ async def generate_control(request: GenerateControlRequest):
         kwargs["instruct"] = request.instruct
 
     logger.info("Generating audio...")
-    results = list(model.generate_custom_voice(**kwargs))
-
-    if not results:
-        raise RuntimeError("No audio generated")
-
-    logger.info("Saving output...")
-    audio = results[0].audio
-    save_audio(audio, sample_rate, request.output_path)
+    await run_mlx(generate_to_file, info.model_id, "generate_custom_voice", kwargs, request.output_path)
     logger.info(f"Generated control audio: {request.output_path}")
 
     return GenerateResponse(output_path=request.output_path, success=True)
@@ -489,11 +608,9 @@ async def generate_design(request: GenerateDesignRequest):
     info = registry.get_model(registry.DESIGN_MODEL)
     if not info or info.state != ModelState.LOADED:
         raise HTTPException(status_code=400, detail="VoiceDesign model not loaded")
+    validate_output_path(request.output_path)
 
-    model = info.model_instance
-    sample_rate = model.sample_rate
-
-    logger.info("Preparing voice design parameters...")
+    logger.debug("Preparing voice design parameters...")
 
     kwargs = {
         "text": request.text,
@@ -502,14 +619,7 @@ async def generate_design(request: GenerateDesignRequest):
     }
 
     logger.info("Generating audio with custom voice design...")
-    results = list(model.generate_voice_design(**kwargs))
-
-    if not results:
-        raise RuntimeError("No audio generated")
-
-    logger.info("Saving output...")
-    audio = results[0].audio
-    save_audio(audio, sample_rate, request.output_path)
+    await run_mlx(generate_to_file, info.model_id, "generate_voice_design", kwargs, request.output_path)
     logger.info(f"Generated design audio: {request.output_path}")
 
     return GenerateResponse(output_path=request.output_path, success=True)
@@ -525,8 +635,12 @@ def main():
     parser = argparse.ArgumentParser(description="TTS HTTP Server")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8765, help="Port to bind to")
+    parser.add_argument("--preload", nargs="+", default=[], metavar="MODEL_ID",
+                        help="Model IDs to load at startup")
     args = parser.parse_args()
 
+    app.state.preload_model_ids = args.preload
+
     logger.info(f"Starting TTS HTTP Server on {args.host}:{args.port}")
 
     uvicorn.run(
@@ -534,6 +648,11 @@ def main():
         host=args.host,
         port=args.port,
         log_level="warning",  # Suppress uvicorn's own logging, we handle our own
+        loop="uvloop",
+        http="httptools",
+        # Loaded models live in this process's registry; extra workers would
+        # each hold their own copy of the weights and their own model states
+        workers=1,
     )
 
 